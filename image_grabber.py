@@ -27,10 +27,15 @@ Usage Examples:
 """
 
 import argparse
+import atexit
 import concurrent.futures
-import hashlib
+import contextlib
+import functools
+import json
 import os
 import re
+import shutil
+import struct
 import threading
 import time
 import sys
@@ -40,17 +45,27 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import requests
+from urllib3.util.retry import Retry
 try:
 	from ddgs import DDGS
 	from ddgs.exceptions import RatelimitException
 except ImportError:
 	from duckduckgo_search import DDGS
 	from duckduckgo_search.exceptions import RatelimitException
+try:
+	import httpx
+	import h2  # noqa: F401 - required by httpx for HTTP/2
+except ImportError:
+	httpx = None
 from tqdm import tqdm
+import xxhash
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import undetected_chromedriver as uc
 
@@ -58,8 +73,60 @@ import undetected_chromedriver as uc
 if sys.platform.startswith("win"):
 	asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-# Thread-local session for connection pooling per worker
-_thread_local = threading.local()
+# Characters not allowed in folder names, mapped to "_"
+_SANI = str.maketrans({c: "_" for c in '\\/:*?"<>|'})
+
+# Full-size image entries embedded in the Google Images SERP: ["url",height,width] and the legacy "ou"/"ow"/"oh" form
+_GOOGLE_IMG_ARRAY = re.compile(r'\["(https?://[^"]+?)",(\d+),(\d+)\]')
+_GOOGLE_IMG_LEGACY = re.compile(r'"ou":"(.*?)","ow":(\d+),"oh":(\d+)')
+
+# Skip candidates that declare a body larger than this before downloading it
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
+# Bytes read up front to sniff real dimensions when a size filter is active
+PROBE_BYTES = 32 * 1024
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Copy buffer for streaming image bodies straight from the socket to disk
+COPY_BUFFER_BYTES = 1 << 20
+
+# Per-topic index of already-downloaded URLs, keyed by the URL hash used in file names
+CACHE_FILE_NAME = ".grabber_cache.json"
+_CACHE_LOCK = threading.Lock()
+
+# Chrome flags shared by every launch; headless mode is added per call
+_CHROME_ARGS = (
+	"--no-sandbox",
+	"--disable-gpu",
+	"--disable-dev-shm-usage",
+	"--window-size=1366,768",
+	"--disable-blink-features=AutomationControlled",
+	"--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+)
+
+# One Chrome instance reused across browser scrapes; quit at interpreter exit
+_DRIVER = None
+_DRIVER_SHOW_BROWSER = False
+_DRIVER_LOCK = threading.Lock()
+
+_DEFAULT_HEADERS = {
+	"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win32; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+	"Accept": "*/*",
+	"Accept-Language": "en-US,en;q=0.9",
+	"Referer": "https://www.google.com/",
+}
+
+# Retry policy shared by the requests and httpx backends
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Process-wide session so all download workers share one keep-alive pool
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Optional HTTP/2 client (httpx[http2]) that multiplexes downloads to the same host over one connection
+_HTTP2_CLIENT = None
+_HTTP2_CLIENT_LOCK = threading.Lock()
 
 
 def log(verbose: bool, message: str) -> None:
@@ -67,47 +134,111 @@ def log(verbose: bool, message: str) -> None:
 		print(message, flush=True)
 
 
-def get_session(timeout: int) -> requests.Session:
-	if getattr(_thread_local, "session", None) is None:
-		s = requests.Session()
-		s.headers.update({
-			"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win32; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-			"Accept": "*/*",
-			"Accept-Language": "en-US,en;q=0.9",
-			"Referer": "https://www.google.com/",
-		})
-		# Configure session for better connection handling
-		adapter = requests.adapters.HTTPAdapter(
-			pool_connections=1,
-			pool_maxsize=1,
-			max_retries=3
-		)
-		s.mount('http://', adapter)
-		s.mount('https://', adapter)
-		_thread_local.session = s
-	_thread_local.timeout = timeout
-	return _thread_local.session
+def get_session(max_concurrent: int = 8) -> requests.Session:
+	global _SESSION
+	if _SESSION is not None:
+		return _SESSION
+	with _SESSION_LOCK:
+		if _SESSION is None:
+			s = requests.Session()
+			s.headers.update(_DEFAULT_HEADERS)
+			# Keep-alive pool large enough for every worker to reuse TLS connections to the same CDN hosts
+			adapter = requests.adapters.HTTPAdapter(
+				pool_connections=32,
+				pool_maxsize=max_concurrent * 4,
+				max_retries=Retry(
+					total=_RETRY_TOTAL,
+					backoff_factor=_RETRY_BACKOFF,
+					status_forcelist=_RETRY_STATUSES,
+					allowed_methods=frozenset(["GET", "HEAD"]),
+				),
+			)
+			s.mount('http://', adapter)
+			s.mount('https://', adapter)
+			_SESSION = s
+	return _SESSION
+
+
+def get_http2_client(max_concurrent: int = 8):
+	global _HTTP2_CLIENT
+	if httpx is None or _HTTP2_CLIENT is not None:
+		return _HTTP2_CLIENT
+	with _HTTP2_CLIENT_LOCK:
+		if _HTTP2_CLIENT is None:
+			_HTTP2_CLIENT = httpx.Client(
+				headers=_DEFAULT_HEADERS,
+				follow_redirects=True,
+				transport=httpx.HTTPTransport(
+					http2=True,
+					retries=_RETRY_TOTAL,
+					limits=httpx.Limits(max_connections=max_concurrent * 4, max_keepalive_connections=32),
+				),
+			)
+	return _HTTP2_CLIENT
+
+
+@contextlib.contextmanager
+def _open_stream(url: str, timeout: int, rate_limiter: Optional["RateLimiter"] = None):
+	# Yields (status, headers, body); body is a file-like for requests or a chunk iterator for httpx
+	client = get_http2_client()
+	if client is not None:
+		# httpx transport retries only cover connection errors; retry 429/5xx here like urllib3's Retry does.
+		# Each resend takes its own rate-limiter slot.
+		for attempt in range(_RETRY_TOTAL + 1):
+			if rate_limiter:
+				rate_limiter.wait()
+			resp = client.send(client.build_request("GET", url, timeout=timeout), stream=True)
+			if resp.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+				break
+			resp.close()
+			retry_after = resp.headers.get("Retry-After", "")
+			time.sleep(min(int(retry_after), 30) if retry_after.isdigit() else _RETRY_BACKOFF * (2 ** attempt))
+		try:
+			yield resp.status_code, resp.headers, resp.iter_bytes(65536)
+		finally:
+			resp.close()
+		return
+	if rate_limiter:
+		rate_limiter.wait()
+	resp = get_session().get(url, stream=True, timeout=timeout)
+	try:
+		resp.raw.decode_content = True
+		yield resp.status_code, resp.headers, resp.raw
+	finally:
+		resp.close()
+
+
+class RateLimiter:
+	# Spaces calls evenly so raising --max-concurrent cannot exceed the requested rate
+	def __init__(self, per_second: float) -> None:
+		self._interval = 1.0 / per_second
+		self._next_slot = 0.0
+		self._lock = threading.Lock()
+
+	def wait(self) -> None:
+		with self._lock:
+			now = time.monotonic()
+			slot = max(now, self._next_slot)
+			self._next_slot = slot + self._interval
+		delay = slot - now
+		if delay > 0:
+			time.sleep(delay)
 
 
 def sanitize_folder_name(name: str) -> str:
-	name = name.strip()
-	name = re.sub(r"[\\/:*?\"<>|]", "_", name)
-	name = re.sub(r"\s+", " ", name)
-	return name[:100] if len(name) > 100 else name
+	return " ".join(name.translate(_SANI).split())[:100]
 
 
 def choose_best_url(result: Dict) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+	get = result.get
 	candidates: List[Tuple[str, Optional[int], Optional[int]]] = []
 	for key in ("image", "url", "thumbnail"):
-		url = result.get(key) or result.get("image") if key == "url" else result.get(key)
+		url = get(key) or get("image") if key == "url" else get(key)
 		if url:
-			w = result.get("width") or result.get("image_width")
-			h = result.get("height") or result.get("image_height")
+			w = get("width") or get("image_width")
+			h = get("height") or get("image_height")
 			candidates.append((url, w, h))
-	if not candidates:
-		return None
-	candidates.sort(key=lambda x: (x[1] or 0) * (x[2] or 0), reverse=True)
-	return candidates[0]
+	return max(candidates, key=lambda c: (c[1] or 0) * (c[2] or 0)) if candidates else None
 
 
 def fetch_results_ddg(query: str, limit: int, min_width: int, min_height: int) -> List[Dict]:
@@ -117,6 +248,8 @@ def fetch_results_ddg(query: str, limit: int, min_width: int, min_height: int) -
 		try:
 			with DDGS() as ddgs:
 				results = []
+				# Without a size filter every hit is usable, so don't ask DDG for spares
+				unfiltered = not min_width and not min_height
 				for r in ddgs.images(
 					query=query,
 					region="wt-wt",
@@ -125,14 +258,16 @@ def fetch_results_ddg(query: str, limit: int, min_width: int, min_height: int) -
 					color=None,
 					type_image=None,
 					layout=None,
-					max_results=max(10, limit * 2),
+					max_results=limit if unfiltered else max(10, limit * 2),
 				):
-					w = r.get("width") or r.get("image_width") or 0
-					h = r.get("height") or r.get("image_height") or 0
-					if w >= min_width and h >= min_height:
-						results.append(r)
-						if len(results) >= limit:
-							break
+					if not unfiltered:
+						w = r.get("width") or r.get("image_width") or 0
+						h = r.get("height") or r.get("image_height") or 0
+						if w < min_width or h < min_height:
+							continue
+					results.append(r)
+					if len(results) >= limit:
+						break
 				return results
 		except RatelimitException:
 			attempt += 1
@@ -142,79 +277,172 @@ def fetch_results_ddg(query: str, limit: int, min_width: int, min_height: int) -
 			wait_seconds = min(wait_seconds * 2, 30)
 
 
+def _fetch_cse_page(api_key: str, cx: str, query: str, start_index: int, num: int) -> List[Dict]:
+	resp = get_session().get(
+		"https://www.googleapis.com/customsearch/v1",
+		params={
+			"q": query,
+			"searchType": "image",
+			"num": num,
+			"start": start_index,
+			"safe": "off",
+			"key": api_key,
+			"cx": cx,
+		},
+		timeout=20,
+	)
+	if resp.status_code != 200:
+		return []
+	return resp.json().get("items") or []
+
+
 def fetch_results_google_cse(api_key: str, cx: str, query: str, limit: int, min_width: int, min_height: int) -> List[Dict]:
 	results: List[Dict] = []
-	start_index = 1
-	session = get_session(timeout=20)
-	while len(results) < limit and start_index <= 91:
-		num = min(10, limit - len(results))
+	# The API serves at most 10 pages of 10; request the pages still needed in parallel.
+	# Pages are always full (num=10) so the fixed start offsets never skip results; the list is trimmed at the end.
+	num = 10
+	starts = list(range(1, 92, num))
+	with concurrent.futures.ThreadPoolExecutor(max_workers=5) as ex:
+		while len(results) < limit and starts:
+			pages_needed = -(-(limit - len(results)) // num)
+			batch, starts = starts[:pages_needed], starts[pages_needed:]
+			pages = list(ex.map(lambda start: _fetch_cse_page(api_key, cx, query, start, num), batch))
+			for items in pages:
+				for it in items:
+					link = it.get("link")
+					image_info = it.get("image") or {}
+					w = int(image_info.get("width")) if image_info.get("width") else 0
+					h = int(image_info.get("height")) if image_info.get("height") else 0
+					if w >= min_width and h >= min_height and link:
+						results.append({"image": link, "width": w, "height": h})
+			if any(len(items) < num for items in pages):
+				break
+	return results[:limit]
+
+
+def _parse_google_images(html: str, limit: int, min_width: int, min_height: int) -> List[Dict]:
+	results: List[Dict] = []
+	found: List[Tuple[str, int, int]] = [(u, int(w), int(h)) for u, h, w in _GOOGLE_IMG_ARRAY.findall(html)]
+	found.extend((u, int(w), int(h)) for u, w, h in _GOOGLE_IMG_LEGACY.findall(html))
+	seen = set()
+	for raw_url, w, h in found:
+		try:
+			url = json.loads(f'"{raw_url}"')
+		except ValueError:
+			continue
+		# Skip Google's own thumbnail copies; the original follows them in the payload
+		if "gstatic.com" in url or url in seen:
+			continue
+		seen.add(url)
+		if w >= min_width and h >= min_height:
+			results.append({"image": url, "width": w, "height": h})
+			if len(results) >= limit:
+				break
+	return results
+
+
+def fetch_results_http_google(query: str, limit: int, min_width: int, min_height: int, *, verbose: bool = False, timeout: int = 20) -> List[Dict]:
+	results: List[Dict] = []
+	session = get_session()
+	try:
 		resp = session.get(
-			"https://www.googleapis.com/customsearch/v1",
-			params={
-				"q": query,
-				"searchType": "image",
-				"num": num,
-				"start": start_index,
-				"safe": "off",
-				"key": api_key,
-				"cx": cx,
-			},
-			timeout=_thread_local.timeout,
+			"https://www.google.com/search",
+			params={"tbm": "isch", "q": query, "hl": "en"},
+			timeout=timeout,
 		)
-		if resp.status_code != 200:
-			break
-		data = resp.json()
-		items = data.get("items") or []
-		if not items:
-			break
-		for it in items:
-			link = it.get("link")
-			image_info = it.get("image") or {}
-			w = int(image_info.get("width")) if image_info.get("width") else 0
-			h = int(image_info.get("height")) if image_info.get("height") else 0
-			if w >= min_width and h >= min_height and link:
-				results.append({"image": link, "width": w, "height": h})
-				if len(results) >= limit:
-					break
-		start_index += len(items)
+	except requests.RequestException as e:
+		log(verbose, f"[http] google request failed: {e}")
+		return results
+	if resp.status_code != 200:
+		log(verbose, f"[http] google status {resp.status_code}")
+		return results
+	results = _parse_google_images(resp.text, limit, min_width, min_height)
+	log(verbose, f"[http] google parsed {len(results)} images")
 	return results
 
 
-def fetch_results_browser_google(query: str, limit: int, min_width: int, min_height: int, *, verbose: bool = False, max_time_seconds: int = 90, show_browser: bool = False) -> List[Dict]:
-	results: List[Dict] = []
+def _quit_driver() -> None:
+	global _DRIVER
+	if _DRIVER is not None:
+		try:
+			_DRIVER.quit()
+		except Exception:
+			pass
+		_DRIVER = None
+
+
+atexit.register(_quit_driver)
+
+
+def _build_chrome_options(show_browser: bool) -> ChromeOptions:
 	options = ChromeOptions()
 	if not show_browser:
 		options.add_argument("--headless=new")
-	options.add_argument("--no-sandbox")
-	options.add_argument("--disable-gpu")
-	options.add_argument("--disable-dev-shm-usage")
-	options.add_argument("--window-size=1366,768")
-	options.add_argument("--disable-blink-features=AutomationControlled")
-	options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
-	
+	for arg in _CHROME_ARGS:
+		options.add_argument(arg)
+	return options
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_path() -> str:
+	# With CHROMEDRIVER_VERSION pinned, reuse that exact driver from ~/.wdm and skip the online check.
+	# Unpinned, let webdriver-manager match the installed Chrome, since a cached driver may be stale after a Chrome update.
+	version = os.environ.get("CHROMEDRIVER_VERSION")
+	if version:
+		exe = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+		for cached in (Path.home() / ".wdm" / "drivers" / "chromedriver").rglob(exe):
+			if version in cached.relative_to(Path.home() / ".wdm").parts:
+				return str(cached)
+	return ChromeDriverManager(driver_version=version).install()
+
+
+def _get_driver(show_browser: bool, verbose: bool):
+	# Caller must hold _DRIVER_LOCK
+	global _DRIVER, _DRIVER_SHOW_BROWSER
+	if _DRIVER is not None and _DRIVER_SHOW_BROWSER == show_browser:
+		return _DRIVER
+	_quit_driver()
 	# Use webdriver-manager to automatically handle ChromeDriver version
 	try:
-		service = Service(ChromeDriverManager().install())
-		driver = uc.Chrome(options=options, service=service)
+		service = Service(_driver_path())
+		driver = uc.Chrome(options=_build_chrome_options(show_browser), service=service)
 	except Exception as e:
 		log(verbose, f"[browser] webdriver-manager failed, trying direct: {e}")
-		# Create new options object for retry
-		options_retry = ChromeOptions()
-		if not show_browser:
-			options_retry.add_argument("--headless=new")
-		options_retry.add_argument("--no-sandbox")
-		options_retry.add_argument("--disable-gpu")
-		options_retry.add_argument("--disable-dev-shm-usage")
-		options_retry.add_argument("--window-size=1366,768")
-		options_retry.add_argument("--disable-blink-features=AutomationControlled")
-		options_retry.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
-		driver = uc.Chrome(options=options_retry)
+		# Options objects can't be reused after a failed launch
+		driver = uc.Chrome(options=_build_chrome_options(show_browser))
+	_DRIVER = driver
+	_DRIVER_SHOW_BROWSER = show_browser
+	return driver
+
+
+def fetch_results_browser_google(query: str, limit: int, min_width: int, min_height: int, *, verbose: bool = False, max_time_seconds: int = 90, show_browser: bool = False) -> List[Dict]:
+	with _DRIVER_LOCK:
+		driver = _get_driver(show_browser, verbose)
+		try:
+			return _scrape_google_images(driver, query, limit, min_width, min_height, verbose=verbose, max_time_seconds=max_time_seconds)
+		except Exception:
+			# A failed session may leave Chrome unusable; start fresh next time
+			_quit_driver()
+			raise
+
+
+def _wait_for(driver, timeout: float, condition) -> bool:
+	try:
+		WebDriverWait(driver, timeout).until(condition)
+		return True
+	except TimeoutException:
+		return False
+
+
+def _scrape_google_images(driver, query: str, limit: int, min_width: int, min_height: int, *, verbose: bool, max_time_seconds: int) -> List[Dict]:
+	results: List[Dict] = []
 	start_time = time.monotonic()
 	try:
 		url = f"https://www.google.com/search?tbm=isch&q={requests.utils.quote(query)}"
+		thumb_selector = "img[jsname='Q4LuWd']"
 		log(verbose, f"[browser] goto: {url}")
 		driver.get(url)
-		time.sleep(2)
+		_wait_for(driver, 10, EC.presence_of_element_located((By.CSS_SELECTOR, f"{thumb_selector}, #L2AGLb, button[aria-label]")))
 		# Try to accept consent if present
 		for selector in [
 			"button[aria-label='Accept all']",
@@ -226,75 +454,56 @@ def fetch_results_browser_google(query: str, limit: int, min_width: int, min_hei
 				if btns:
 					btns[0].click()
 					log(verbose, f"[browser] clicked consent: {selector}")
-					time.sleep(1)
+					_wait_for(driver, 10, EC.presence_of_element_located((By.CSS_SELECTOR, thumb_selector)))
 					break
 			except Exception:
 				pass
-		thumb_selector = "img[jsname='Q4LuWd']"
-		large_selector = "img.n3VNCb"
-		index = 0
-		last_count = 0
+		# Full-size URLs live in the page's embedded result payload, not in the thumbnail <img> tags;
+		# read the whole document once per scroll and parse it like fetch_results_http_google does
 		empty_scrolls = 0
-		while len(results) < limit:
-			# Time budget
+		while True:
+			html = driver.execute_script("return document.documentElement.innerHTML;") or ""
+			results = _parse_google_images(html, limit, min_width, min_height)
+			if len(results) >= limit:
+				break
 			if time.monotonic() - start_time > max_time_seconds:
 				log(verbose, "[browser] timeout waiting for enough results")
 				break
-			thumbs = driver.find_elements(By.CSS_SELECTOR, thumb_selector)
-			count = len(thumbs)
-			if count == 0:
-				log(verbose, "[browser] no thumbnails yet, scrolling")
-				driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-				time.sleep(1)
-				continue
-			if count == last_count:
-				empty_scrolls += 1
-			else:
+			log(verbose, f"[browser] need more images; scrolling (have {len(results)})")
+			have = driver.execute_script("return document.images.length;") or 0
+			driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
+			if _wait_for(driver, 2, lambda d: (d.execute_script("return document.images.length;") or 0) > have):
 				empty_scrolls = 0
-				last_count = count
-			if empty_scrolls >= 6 and index >= count:
-				log(verbose, "[browser] reached end of page (no new thumbs)")
-				break
-			if index >= count:
-				log(verbose, f"[browser] need more thumbs; scrolling (have {count})")
-				driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-				time.sleep(0.8)
-				continue
-			# Try clicking a thumbnail
-			try:
-				log(verbose, f"[browser] click thumb #{index+1}/{count}")
-				thumbs[index].click()
-				time.sleep(0.8)
-			except Exception as e:
-				log(verbose, f"[browser] thumb click failed: {e}")
-				index += 1
-				continue
-			# Collect large image candidates
-			candidates = driver.find_elements(By.CSS_SELECTOR, large_selector)
-			if not candidates:
-				log(verbose, "[browser] no large images yet")
-				index += 1
-				continue
-			picked = False
-			for img in candidates[:5]:
-				src = img.get_attribute("src") or ""
-				if not src.startswith("http"):
-					continue
-				try:
-					w = img.get_property("naturalWidth") or 0
-					h = img.get_property("naturalHeight") or 0
-				except Exception:
-					w = 0
-					h = 0
-				results.append({"image": src, "width": int(w), "height": int(h)})
-				log(verbose, f"[browser] added image {len(results)}: {int(w)}x{int(h)}")
-				picked = True
-				break
-			if not picked:
-				log(verbose, "[browser] no valid candidate srcs")
-			index += 1
+			else:
+				empty_scrolls += 1
+				if empty_scrolls >= 6:
+					log(verbose, "[browser] reached end of page (no new images)")
+					break
+		log(verbose, f"[browser] collected {len(results)} images")
 	finally:
-		driver.quit()
+		# Drop page state so the next query starts clean
+		driver.get("about:blank")
+	return results[:limit]
+
+
+def fetch_results_google_images(query: str, limit: int, min_width: int, min_height: int, *, verbose: bool = False, timeout: int = 20, show_browser: bool = False) -> List[Dict]:
+	# Plain HTTP first; only start Chrome to top up when the parsed page came up short
+	results = fetch_results_http_google(query, limit, min_width, min_height, verbose=verbose, timeout=timeout)
+	if len(results) >= limit:
+		return results
+	log(verbose, f"[http] only {len(results)}/{limit} images, topping up with browser")
+	try:
+		extra = fetch_results_browser_google(query, limit, min_width, min_height, verbose=verbose, show_browser=show_browser)
+	except Exception as e:
+		if not results:
+			raise
+		log(verbose, f"[browser] top-up failed, keeping HTTP results: {e}")
+		return results
+	seen = {r["image"] for r in results}
+	for r in extra:
+		if r["image"] not in seen:
+			seen.add(r["image"])
+			results.append(r)
 	return results[:limit]
 
 
@@ -311,16 +520,148 @@ def guess_ext_from_headers(headers: Dict[str, str], url: str) -> str:
 	return ".img"
 
 
-def download_one(index_and_result: Tuple[int, Dict], out_dir: Path, timeout: int, verbose: bool, max_retries: int = 2) -> Optional[Path]:
-	idx, result = index_and_result
-	choice = choose_best_url(result)
-	if not choice:
-		log(verbose, f"[dl] #{idx} no usable url")
+def sniff_image_size(head: bytes) -> Optional[Tuple[int, int]]:
+	if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR" and len(head) >= 24:
+		return struct.unpack(">II", head[16:24])
+	if head[:6] in (b"GIF87a", b"GIF89a") and len(head) >= 10:
+		return struct.unpack("<HH", head[6:10])
+	if head[:2] == b"\xff\xd8":
+		i = 2
+		while i + 9 <= len(head):
+			if head[i] != 0xFF:
+				i += 1
+				continue
+			marker = head[i + 1]
+			if marker == 0xFF:
+				i += 1
+				continue
+			if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+				i += 2
+				continue
+			if marker in _JPEG_SOF_MARKERS:
+				h, w = struct.unpack(">HH", head[i + 5:i + 9])
+				return w, h
+			(seg_len,) = struct.unpack(">H", head[i + 2:i + 4])
+			i += 2 + seg_len
+	return None
+
+
+def url_hash(url: str) -> str:
+	# 16 hex chars for file names and cache keys; must not vary between runs
+	return xxhash.xxh3_64_hexdigest(url.encode("utf-8"))
+
+
+def _load_cache(out_dir: Path) -> Dict[str, Dict]:
+	cache_file = out_dir / CACHE_FILE_NAME
+	try:
+		with open(cache_file, "r", encoding="utf-8") as f:
+			data = json.load(f)
+	except (OSError, ValueError):
+		return {}
+	return data if isinstance(data, dict) else {}
+
+
+def _save_cache(out_dir: Path, cache: Dict[str, Dict]) -> None:
+	cache_file = out_dir / CACHE_FILE_NAME
+	tmp_file = cache_file.with_suffix(".tmp")
+	with _CACHE_LOCK:
+		with open(tmp_file, "w", encoding="utf-8") as f:
+			json.dump(cache, f)
+	os.replace(tmp_file, cache_file)
+
+
+def _cached_file(cache: Optional[Dict[str, Dict]], hsh: str, out_dir: Path) -> Optional[Path]:
+	if cache is None:
+		return None
+	with _CACHE_LOCK:
+		entry = cache.get(hsh)
+	if not entry:
 		return None
-	url, w, h = choice
-	hsh = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+	out_file = out_dir / entry.get("path", "")
+	# Only trust files whose size still matches what was written when the entry was recorded
+	if out_file.is_file() and out_file.stat().st_size == entry.get("size", -1):
+		return out_file
+	return None
+
+
+def _remember_file(cache: Optional[Dict[str, Dict]], hsh: str, out_file: Path, headers: Optional[Dict[str, str]] = None) -> None:
+	# Call only after a completed write
+	if cache is None:
+		return
+	headers = headers or {}
+	size = out_file.stat().st_size
+	with _CACHE_LOCK:
+		cache[hsh] = {
+			"path": out_file.name,
+			"size": size,
+			"etag": headers.get("ETag"),
+			"len": headers.get("Content-Length"),
+		}
+
+
+def _read_head(body, size: int):
+	if hasattr(body, "read"):
+		return body.read(size), body
+	parts: List[bytes] = []
+	got = 0
+	for chunk in body:
+		parts.append(chunk)
+		got += len(chunk)
+		if got >= size:
+			break
+	return b"".join(parts), body
+
+
+def _write_response(out_file: Path, headers, body, head: bytes = b"") -> None:
+	# Write under a temporary name so an interrupted body never looks like a finished file
+	part_file = out_file.with_suffix(".part")
+	fd = os.open(part_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+	try:
+		_copy_body(fd, headers, body, head)
+		os.replace(part_file, out_file)
+	except BaseException:
+		try:
+			part_file.unlink()
+		except OSError:
+			pass
+		raise
+
+
+def _copy_body(fd: int, headers, body, head: bytes) -> None:
+	with open(fd, "wb") as f:
+		content_length = headers.get("Content-Length", "")
+		preallocated = False
+		if content_length.isdigit() and hasattr(os, "posix_fallocate"):
+			size = int(content_length)
+			try:
+				os.posix_fallocate(fd, 0, size)
+				os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+				preallocated = True
+			except OSError:
+				pass
+		f.write(head)
+		if hasattr(body, "read"):
+			# Not os.sendfile: the socket carries TLS, chunked and compressed framing that urllib3 has to undo,
+			# and Linux sendfile cannot read from a socket anyway. 1 MiB chunks bypass the BufferedWriter copy.
+			shutil.copyfileobj(body, f, COPY_BUFFER_BYTES)
+		else:
+			for chunk in body:
+				f.write(chunk)
+		if preallocated:
+			# Content-Length counts encoded bytes; trim any preallocated tail
+			f.truncate()
+
+
+def download_one(index_and_choice: Tuple[int, Tuple[str, Optional[int], Optional[int]]], out_dir: Path, timeout: int, verbose: bool, max_retries: int = 2, cache: Optional[Dict[str, Dict]] = None, min_width: int = 0, min_height: int = 0, rate_limiter: Optional[RateLimiter] = None) -> Optional[Path]:
+	idx, (url, w, h) = index_and_choice
+	hsh = url_hash(url)
 	name_base = f"{idx:04d}_{w or 0}x{h or 0}_{hsh}"
 
+	cached = _cached_file(cache, hsh, out_dir)
+	if cached:
+		log(verbose, f"[dl] #{idx} cached, skip -> {cached.name}")
+		return cached
+
 	# Handle data URLs directly
 	if url.startswith("data:"):
 		try:
@@ -339,31 +680,41 @@ def download_one(index_and_result: Tuple[int, Dict], out_dir: Path, timeout: int
 			elif "gif" in mime:
 				ext = ".gif"
 			out_file = out_dir / f"{name_base}{ext}"
-			if not out_file.exists() or out_file.stat().st_size == 0:
+			if not out_file.exists() or out_file.stat().st_size != len(data):
 				with open(out_file, "wb") as f:
 					f.write(data)
+			_remember_file(cache, hsh, out_file)
 			log(verbose, f"[dl] #{idx} saved data URL -> {out_file.name}")
 			return out_file
 		except Exception as e:
 			log(verbose, f"[dl] #{idx} data URL failed: {e}")
 			return None
 
-	session = get_session(timeout)
 	last_err: Optional[Exception] = None
 	for attempt in range(max_retries + 1):
 		try:
-			resp = session.get(url, stream=True, timeout=_thread_local.timeout)
-			if resp.status_code != 200:
-				raise RuntimeError(f"status {resp.status_code}")
-			ext = guess_ext_from_headers(resp.headers, url)
-			out_file = out_dir / f"{name_base}{ext}"
-			if out_file.exists() and out_file.stat().st_size > 0:
-				log(verbose, f"[dl] #{idx} exists, skip -> {out_file.name}")
-				return out_file
-			with open(out_file, "wb") as f:
-				for chunk in resp.iter_content(chunk_size=64 * 1024):
-					if chunk:
-						f.write(chunk)
+			with _open_stream(url, timeout, rate_limiter) as (status, headers, body):
+				if status != 200:
+					raise RuntimeError(f"status {status}")
+				content_length = headers.get("Content-Length", "")
+				if content_length.isdigit() and int(content_length) > MAX_DOWNLOAD_BYTES:
+					log(verbose, f"[dl] #{idx} too large ({content_length} bytes), skip")
+					return None
+				ext = guess_ext_from_headers(headers, url)
+				out_file = out_dir / f"{name_base}{ext}"
+				if out_file.exists() and out_file.stat().st_size > 0:
+					log(verbose, f"[dl] #{idx} exists, skip -> {out_file.name}")
+					return out_file
+				head = b""
+				if min_width or min_height:
+					# Declared sizes from search APIs are unreliable; check the real header before the full body
+					head, body = _read_head(body, PROBE_BYTES)
+					size = sniff_image_size(head)
+					if size and (size[0] < min_width or size[1] < min_height):
+						log(verbose, f"[dl] #{idx} actual size {size[0]}x{size[1]} below filter, skip")
+						return None
+				_write_response(out_file, headers, body, head)
+			_remember_file(cache, hsh, out_file, headers)
 			log(verbose, f"[dl] #{idx} OK -> {out_file.name}")
 			return out_file
 		except Exception as e:
@@ -376,25 +727,29 @@ def download_one(index_and_result: Tuple[int, Dict], out_dir: Path, timeout: int
 	return None
 
 
-def run(query: str, limit: int, out_base: Path, max_concurrent: int, timeout: int, min_width: int, min_height: int, engine: str, google_api_key: Optional[str], google_cx: Optional[str], *, verbose: bool = False, show_browser: bool = False) -> None:
+def run(query: str, limit: int, out_base: Path, max_concurrent: int, timeout: int, min_width: int, min_height: int, engine: str, google_api_key: Optional[str], google_cx: Optional[str], *, verbose: bool = False, show_browser: bool = False, rate_limit: float = 0.0) -> None:
 	topic_dir_name = sanitize_folder_name(query)
 	out_dir = out_base / topic_dir_name
 	out_dir.mkdir(parents=True, exist_ok=True)
+	get_session(max_concurrent)
+	get_http2_client(max_concurrent)
 
+	# Ask for spare candidates so failed downloads can be replaced
+	fetch_limit = limit + max(5, limit // 4)
 	results: List[Dict] = []
 	try:
 		if engine == "google":
 			if not google_api_key or not google_cx:
 				raise SystemExit("Google engine selected but --google-api-key and --google-cx are required.")
-			results = fetch_results_google_cse(google_api_key, google_cx, query, limit, min_width, min_height)
+			results = fetch_results_google_cse(google_api_key, google_cx, query, fetch_limit, min_width, min_height)
 		elif engine == "browser":
-			results = fetch_results_browser_google(query, limit, min_width, min_height, verbose=verbose, show_browser=show_browser)
+			results = fetch_results_google_images(query, fetch_limit, min_width, min_height, verbose=verbose, timeout=timeout, show_browser=show_browser)
 		else:
-			results = fetch_results_ddg(query, limit, min_width, min_height)
+			results = fetch_results_ddg(query, fetch_limit, min_width, min_height)
 	except RatelimitException:
-		print("DuckDuckGo rate-limited. Switching to browser crawling...")
+		print("DuckDuckGo rate-limited. Switching to Google Images...")
 		try:
-			results = fetch_results_browser_google(query, limit, min_width, min_height, verbose=verbose, show_browser=show_browser)
+			results = fetch_results_google_images(query, fetch_limit, min_width, min_height, verbose=verbose, timeout=timeout, show_browser=show_browser)
 		except Exception as e:
 			print(f"Browser crawling failed: {e}")
 			return
@@ -402,22 +757,53 @@ def run(query: str, limit: int, out_base: Path, max_concurrent: int, timeout: in
 		print(f"Search failed: {e}")
 		return
 
-	if not results:
+	# Pick each result's URL once and drop repeats (mirrors, same CDN) before dispatching
+	choices: List[Tuple[str, Optional[int], Optional[int]]] = []
+	seen = set()
+	for r in results:
+		choice = choose_best_url(r)
+		if choice and choice[0] not in seen:
+			seen.add(choice[0])
+			choices.append(choice)
+
+	if not choices:
 		print("No results matched the filters.")
 		return
 
-	print(f"Found {len(results)} candidates. Starting downloads...")
+	print(f"Found {len(choices)} candidates. Starting downloads...")
 	success_count = 0
+	cache = _load_cache(out_dir)
+	rate_limiter = RateLimiter(rate_limit) if rate_limit > 0 else None
+	jobs = iter(enumerate(choices))
 	with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent) as ex:
-		jobs = list(enumerate(results))
-		progress = tqdm(total=len(jobs), desc="Downloading", unit="img")
-		for saved in ex.map(lambda x: download_one(x, out_dir, timeout, verbose), jobs):
-			if saved:
-				success_count += 1
-			progress.update(1)
+		in_flight = set()
+
+		def submit_next() -> None:
+			job = next(jobs, None)
+			if job is not None:
+				in_flight.add(ex.submit(download_one, job, out_dir, timeout, verbose, cache=cache, min_width=min_width, min_height=min_height, rate_limiter=rate_limiter))
+
+		# Never run more downloads than images still wanted; a spare candidate is started only when one fails
+		for _ in range(min(limit, len(choices))):
+			submit_next()
+		progress = tqdm(total=min(limit, len(choices)), desc="Downloading", unit="img")
+		# Handle downloads as they finish so one slow host does not hold back the rest
+		while in_flight:
+			done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+			for fut in done:
+				if fut.result():
+					success_count += 1
+					progress.update(1)
+				else:
+					submit_next()
 		progress.close()
 
-	print(f"Saved {success_count}/{len(results)} images to: {out_dir}")
+	try:
+		_save_cache(out_dir, cache)
+	except OSError as e:
+		log(verbose, f"[cache] could not write {CACHE_FILE_NAME}: {e}")
+
+	print(f"Saved {min(success_count, limit)}/{limit} images to: {out_dir}")
 
 
 def run_simple(query: str) -> None:
@@ -448,7 +834,8 @@ def main() -> None:
 	parser.add_argument("--query", "-q", required=True, help="Search topic text.")
 	parser.add_argument("--limit", "-n", type=int, default=50, help="Number of images to download.")
 	parser.add_argument("--out", "-o", default="downloads", help="Base output directory.")
-	parser.add_argument("--max-concurrent", type=int, default=8, help="Max concurrent downloads.")
+	parser.add_argument("--max-concurrent", type=int, default=None, help="Max concurrent downloads (default 32, or 8 with --engine google).")
+	parser.add_argument("--rate-limit", type=float, default=0.0, help="Max download requests per second (0 = unlimited).")
 	parser.add_argument("--timeout", type=int, default=20, help="Per-request timeout in seconds.")
 	parser.add_argument("--min-width", type=int, default=0, help="Minimum image width filter.")
 	parser.add_argument("--min-height", type=int, default=0, help="Minimum image height filter.")
@@ -460,11 +847,15 @@ def main() -> None:
 	args = parser.parse_args()
 
 	out_base = Path(args.out)
+	max_concurrent = args.__dict__["max_concurrent"]
+	if max_concurrent is None:
+		# Google CSE is quota-bound; other engines only wait on image hosts
+		max_concurrent = 8 if args.engine == "google" else 32
 	run(
 		query=args.query,
 		limit=args.limit,
 		out_base=out_base,
-		max_concurrent=max(1, args.__dict__["max_concurrent"]),
+		max_concurrent=max(1, max_concurrent),
 		timeout=args.timeout,
 		min_width=args.__dict__["min_width"],
 		min_height=args.__dict__["min_height"],
@@ -473,6 +864,7 @@ def main() -> None:
 		google_cx=args.__dict__["google_cx"],
 		verbose=bool(args.__dict__["verbose"]),
 		show_browser=bool(args.__dict__["show_browser"]),
+		rate_limit=max(0.0, args.__dict__["rate_limit"]),
 	)
 
 